@@ -1,79 +1,258 @@
+import atexit
+import calendar
+import functools
+import itertools
+import os
+import queue
+import re
 import sqlite3
-from datetime import datetime
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+
+PAGE_SIZE = 50
+LIST_COLUMNS = "id, name, category, quantity, purchase_date, status, location, responsible_person"
+ROW_FORMAT = "{:<3} {:<15.15} {:<12.12} {:<6} {:<10} {:<12.12} {:<12.12} {:<12.12}"
+MENU = (
+    "\n🏢 Учет инвентаря\n"
+    "1. 📋 Показать все\n"
+    "2. 🔍 Поиск\n"
+    "3. ➕ Добавить\n"
+    "4. ✏️  Редактировать\n"
+    "5. 🗑️  Удалить\n"
+    "6. 🔎 Подробно\n"
+    "7. ➡️  Следующая страница\n"
+    "8. 🚪 Выход\n"
+    "\nВыберите действие (1-8): "
+)
+_DATE_RE = re.compile(r'(\d{4})-(\d{2})-(\d{2})')
+
+
+def _validate_date(s):
+    if not isinstance(s, str):
+        raise ValueError(f"Неверный формат даты '{s}', ожидается ГГГГ-ММ-ДД")
+    m = _DATE_RE.fullmatch(s)
+    if not m:
+        raise ValueError(f"Неверный формат даты '{s}', ожидается ГГГГ-ММ-ДД")
+    y, mo, d = map(int, m.groups())
+    if not (y >= 1 and 1 <= mo <= 12 and 1 <= d <= calendar.monthrange(y, mo)[1]):
+        raise ValueError(f"Несуществующая дата '{s}'")
+
+
+def _validate_quantity(quantity):
+    if not isinstance(quantity, int) or isinstance(quantity, bool):
+        raise ValueError("Количество должно быть целым числом")
+    if quantity < 0:
+        raise ValueError("Количество не может быть отрицательным")
+
+
+@functools.lru_cache(maxsize=None)
+def _update_sql(cols):
+    return f'UPDATE inventory SET {", ".join(f"{col} = ?" for col in cols)} WHERE id = ?'
+
 
 class InventoryManager:
-    def __init__(self, db_name="office_inventory.db"):
+    VALID_FIELDS = frozenset({'name', 'category', 'status', 'location', 'responsible_person'})
+    UPDATE_FIELDS = frozenset({'name', 'category', 'quantity', 'purchase_date', 'status', 'location',
+                               'responsible_person', 'notes'})
+    _SQL_INSERT = ("INSERT INTO inventory (name, category, quantity, purchase_date, status, location, "
+                   "responsible_person, notes) VALUES (?, ?, ?, ?, ?, ?, ?, ?)")
+    _SQL_DELETE = "DELETE FROM inventory WHERE id = ?"
+    _SQL_SELECT_ALL = f"SELECT {LIST_COLUMNS} FROM inventory ORDER BY name LIMIT ? OFFSET ?"
+    _SQL_SELECT_ONE = "SELECT * FROM inventory WHERE id = ?"
+    
+    def __init__(self, db_name="office_inventory.db", pool_size=0):
+        db_name = os.fspath(db_name)
+        if pool_size > 0 and (db_name in ("", ":memory:") or db_name.startswith("file:")):
+            raise ValueError("Пул читателей требует путь к файлу БД (не ':memory:' и не URI 'file:')")
         self.db_name = db_name
+        self.conn = sqlite3.connect(self.db_name, isolation_level=None, check_same_thread=False)
+        self.conn.executescript('''
+            PRAGMA journal_mode=WAL;
+            PRAGMA synchronous=NORMAL;
+            PRAGMA temp_store=MEMORY;
+            PRAGMA cache_size=-64000;
+            PRAGMA mmap_size=268435456;
+            PRAGMA busy_timeout=5000;
+        ''')
+        self._version = 0
+        self._read_items_cached = functools.lru_cache(maxsize=128)(self._query_items)
         self.init_db()
+        
+        self._reader_pool = None
+        self._executor = None
+        if pool_size > 0:
+            self._reader_pool = queue.Queue()
+            uri = f"{Path(self.db_name).resolve().as_uri()}?mode=ro"
+            for _ in range(pool_size):
+                reader = sqlite3.connect(uri, uri=True, check_same_thread=False)
+                reader.executescript('''
+                    PRAGMA temp_store=MEMORY;
+                    PRAGMA cache_size=-64000;
+                    PRAGMA mmap_size=268435456;
+                    PRAGMA busy_timeout=5000;
+                ''')
+                self._reader_pool.put(reader)
+            self._executor = ThreadPoolExecutor(max_workers=pool_size)
     
     def init_db(self):
-        with sqlite3.connect(self.db_name) as conn:
-            cursor = conn.cursor()
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS inventory (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    name TEXT NOT NULL,
-                    category TEXT NOT NULL,
-                    quantity INTEGER NOT NULL,
-                    purchase_date TEXT NOT NULL,
-                    status TEXT NOT NULL,
-                    location TEXT NOT NULL,
-                    responsible_person TEXT,
-                    notes TEXT
-                )
-            ''')
-            conn.commit()
+        self.conn.executescript('''
+            BEGIN;
+            CREATE TABLE IF NOT EXISTS inventory (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                name TEXT NOT NULL,
+                category TEXT NOT NULL,
+                quantity INTEGER NOT NULL,
+                purchase_date TEXT NOT NULL,
+                status TEXT NOT NULL,
+                location TEXT NOT NULL,
+                responsible_person TEXT,
+                notes TEXT
+            );
+            CREATE INDEX IF NOT EXISTS idx_inventory_name ON inventory(name);
+            CREATE INDEX IF NOT EXISTS idx_inventory_name_nocase ON inventory(name COLLATE NOCASE, name);
+            CREATE INDEX IF NOT EXISTS idx_inventory_category_nocase_name ON inventory(category COLLATE NOCASE, name);
+            CREATE INDEX IF NOT EXISTS idx_inventory_status_nocase_name ON inventory(status COLLATE NOCASE, name);
+            CREATE INDEX IF NOT EXISTS idx_inventory_location_nocase_name ON inventory(location COLLATE NOCASE, name);
+            COMMIT;
+        ''')
+    
+    @contextmanager
+    def _reader(self):
+        if self._reader_pool is None:
+            yield self.conn
+            return
+        conn = self._reader_pool.get()
+        try:
+            yield conn
+        finally:
+            self._reader_pool.put(conn)
+    
+    def close(self):
+        if self.conn is None:
+            return
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            while not self._reader_pool.empty():
+                self._reader_pool.get_nowait().close()
+        try:
+            self.conn.execute("PRAGMA optimize")
+        except sqlite3.Error:
+            pass
+        self.conn.close()
+        self.conn = None
     
     def create_item(self, name, category, quantity, purchase_date, status, location, responsible_person="", notes=""):
+        if self.create_items([(name, category, quantity, purchase_date, status, location, responsible_person, notes)]):
+            print(f"✅ '{name}' добавлен!")
+    
+    def create_items(self, rows, chunk_size=500):
         try:
-            if not all([name, category, purchase_date, status, location]):
-                raise ValueError("Все обязательные поля должны быть заполнены")
-            
-            if quantity < 0:
-                raise ValueError("Количество не может быть отрицательным")
-            
-            datetime.strptime(purchase_date, '%Y-%m-%d')
-            
-            with sqlite3.connect(self.db_name) as conn:
-                cursor = conn.cursor()
-                cursor.execute('''
-                    INSERT INTO inventory 
-                    (name, category, quantity, purchase_date, status, location, responsible_person, notes)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (name, category, quantity, purchase_date, status, location, responsible_person, notes))
-                conn.commit()
-                print(f"✅ '{name}' добавлен!")
+            rows = iter(rows)
+            total = 0
+            cursor = self.conn.cursor()
+            cursor.execute("BEGIN")
+            try:
+                while True:
+                    chunk = [self._validate_row(row) for row in itertools.islice(rows, chunk_size)]
+                    if not chunk:
+                        break
+                    cursor.executemany(self._SQL_INSERT, chunk)
+                    total += len(chunk)
+            except BaseException:
+                cursor.execute("ROLLBACK")
+                raise
+            cursor.execute("COMMIT")
+            if total:
+                self._version += 1
+            return total
                 
         except ValueError as e:
             print(f"❌ Ошибка: {e}")
         except sqlite3.Error as e:
             print(f"❌ Ошибка БД: {e}")
+        return 0
+    
+    def _validate_row(self, row):
+        name, category, quantity, purchase_date, status, location, *rest = row
+        responsible_person = rest[0] if len(rest) > 0 else ""
+        notes = rest[1] if len(rest) > 1 else ""
+        
+        if not all([name, category, purchase_date, status, location]):
+            raise ValueError("Все обязательные поля должны быть заполнены")
+        
+        _validate_quantity(quantity)
+        _validate_date(purchase_date)
+        
+        return (name, category, quantity, purchase_date, status, location, responsible_person, notes)
     
-    def read_items(self, filters=None):
+    def _read_items_list(self, filters=None, limit=PAGE_SIZE, offset=0):
         try:
-            with sqlite3.connect(self.db_name) as conn:
-                cursor = conn.cursor()
+            return self._read_items_cached(self._version, self._filters_key(filters), limit, offset)
                 
-                query = "SELECT * FROM inventory"
-                params = []
-                
-                if filters:
-                    conditions = []
-                    for key, value in filters.items():
-                        if value:
-                            conditions.append(f"{key} LIKE ?")
-                            params.append(f"%{value}%")
-                    
-                    if conditions:
-                        query += " WHERE " + " AND ".join(conditions)
+        except sqlite3.Error as e:
+            print(f"❌ Ошибка чтения: {e}")
+            return ()
+    
+    def read_items_async(self, filters=None, limit=PAGE_SIZE, offset=0):
+        if self._executor is None:
+            raise RuntimeError("Пул читателей не включен (pool_size=0)")
+        return self._executor.submit(self._read_items_list, filters, limit, offset)
+    
+    def iter_items(self, filters=None, limit=PAGE_SIZE, offset=0):
+        try:
+            query, params = self._build_query(self._filters_key(filters), limit, offset)
+            if self._reader_pool is None:
+                yield from self.conn.execute(query, params)
+                return
+            
+            with self._reader() as conn:
+                rows = conn.execute(query, params).fetchmany(limit)
+            yield from rows
                 
-                query += " ORDER BY name"
-                cursor.execute(query, params)
-                return cursor.fetchall()
+        except sqlite3.Error as e:
+            print(f"❌ Ошибка чтения: {e}")
+    
+    def _filters_key(self, filters):
+        return tuple(sorted((key, value) for key, value in (filters or {}).items()
+                            if value and key in self.VALID_FIELDS))
+    
+    def _build_query(self, filters, limit, offset):
+        query = f"SELECT {LIST_COLUMNS} FROM inventory"
+        params = []
+        conditions = []
+        
+        for key, value in filters:
+            if '%' in value or '_' in value:
+                conditions.append(f"{key} LIKE ?")
+            else:
+                conditions.append(f"{key} = ? COLLATE NOCASE")
+            params.append(value)
+        
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions) + " ORDER BY name LIMIT ? OFFSET ?"
+        else:
+            query = self._SQL_SELECT_ALL
+        params.extend([limit, offset])
+        return query, params
+    
+    def _query_items(self, version, filters, limit, offset):
+        with self._reader() as conn:
+            cursor = conn.cursor()
+            cursor.execute(*self._build_query(filters, limit, offset))
+            return tuple(cursor.fetchmany(limit))
+    
+    def get_item_detail(self, item_id):
+        try:
+            with self._reader() as conn:
+                cursor = conn.cursor()
+                cursor.execute(self._SQL_SELECT_ONE, (item_id,))
+                return cursor.fetchone()
                 
         except sqlite3.Error as e:
             print(f"❌ Ошибка чтения: {e}")
-            return []
+            return None
     
     def update_item(self, item_id, **kwargs):
         try:
@@ -81,36 +260,33 @@ class InventoryManager:
                 print("❌ Нет данных для обновления")
                 return
             
-            valid_fields = ['name', 'category', 'quantity', 'purchase_date', 'status', 'location', 'responsible_person', 'notes']
-            update_fields = []
-            params = []
-            
-            for field, value in kwargs.items():
-                if field in valid_fields and value is not None:
-                    if field == 'quantity' and value < 0:
-                        raise ValueError("Количество не может быть отрицательным")
-                    
-                    if field == 'purchase_date':
-                        datetime.strptime(value, '%Y-%m-%d')
-                    
-                    update_fields.append(f"{field} = ?")
-                    params.append(value)
+            cols = tuple(sorted(field for field, value in kwargs.items() if value is not None))
+            unknown = set(cols) - self.UPDATE_FIELDS
+            if unknown:
+                raise ValueError(f"Неизвестные поля: {', '.join(sorted(unknown))}")
             
-            if not update_fields:
+            if not cols:
                 print("❌ Нет полей для обновления")
                 return
             
+            if 'quantity' in cols:
+                _validate_quantity(kwargs['quantity'])
+            
+            if 'purchase_date' in cols:
+                _validate_date(kwargs['purchase_date'])
+            
+            params = [kwargs[col] for col in cols]
             params.append(item_id)
             
-            with sqlite3.connect(self.db_name) as conn:
-                cursor = conn.cursor()
-                cursor.execute(f'UPDATE inventory SET {", ".join(update_fields)} WHERE id = ?', params)
-                
-                if cursor.rowcount == 0:
-                    print(f"❌ ID {item_id} не найден")
-                else:
-                    print(f"✅ ID {item_id} обновлен!")
-                conn.commit()
+            cursor = self.conn.cursor()
+            cursor.execute(_update_sql(cols), params)
+            
+            if cursor.rowcount == 0:
+                print(f"❌ ID {item_id} не найден")
+            else:
+                print(f"✅ ID {item_id} обновлен!")
+            self.conn.commit()
+            self._version += 1
                 
         except ValueError as e:
             print(f"❌ Ошибка: {e}")
@@ -119,125 +295,164 @@ class InventoryManager:
     
     def delete_item(self, item_id):
         try:
-            with sqlite3.connect(self.db_name) as conn:
-                cursor = conn.cursor()
-                cursor.execute("DELETE FROM inventory WHERE id = ?", (item_id,))
-                
-                if cursor.rowcount == 0:
-                    print(f"❌ ID {item_id} не найден")
-                else:
-                    print(f"✅ ID {item_id} удален!")
-                conn.commit()
+            cursor = self.conn.cursor()
+            cursor.execute(self._SQL_DELETE, (item_id,))
+            
+            if cursor.rowcount == 0:
+                print(f"❌ ID {item_id} не найден")
+            else:
+                print(f"✅ ID {item_id} удален!")
+            self.conn.commit()
+            self._version += 1
                 
         except sqlite3.Error as e:
             print(f"❌ Ошибка удаления: {e}")
     
-    def display_items(self, items=None):
+    def display_items(self, items=None, limit=PAGE_SIZE, offset=0, filters=None):
         if items is None:
-            items = self.read_items()
+            items = self._read_items_list(filters, limit=limit, offset=offset)
+        
+        lines = [ROW_FORMAT.format(*item[:8]) for item in items]
+        count = len(lines)
+        
+        if not count:
+            print("📭 Больше записей нет" if offset else "📭 Записей не найдено")
+            return 0
         
-        if not items:
-            print("📭 Записей не найдено")
+        separator = '=' * 100
+        header = f"{'ID':<3} {'Название':<15} {'Категория':<12} {'Кол-во':<6} {'Дата':<10} {'Статус':<12} {'Место':<12} {'Ответственный':<12}"
+        footer = f"Страница {offset // limit + 1}, записи {offset + 1}..{offset + count}"
+        sys.stdout.write("\n".join(["", separator, header, separator, *lines, separator, footer]) + "\n")
+        return count
+    
+    def display_item_detail(self, item_id):
+        item = self.get_item_detail(item_id)
+        if item is None:
+            print(f"❌ ID {item_id} не найден")
             return
         
-        print(f"\n{'='*100}")
-        print(f"{'ID':<3} {'Название':<15} {'Категория':<12} {'Кол-во':<6} {'Дата':<10} {'Статус':<12} {'Место':<12} {'Ответственный':<12}")
-        print(f"{'='*100}")
+        labels = ['ID', 'Название', 'Категория', 'Кол-во', 'Дата', 'Статус', 'Место', 'Ответственный', 'Примечания']
+        sys.stdout.write("\n" + "\n".join(f"{label + ':':<15} {value}" for label, value in zip(labels, item)) + "\n")
+
+def _show_all(manager, state):
+    state['filters'] = None
+    state['offset'] = 0
+    manager.display_items()
+
+
+def _search(manager, state):
+    print("\n🔍 Поиск (оставьте пустым для пропуска)")
+    name = input("Название: ").strip()
+    category = input("Категория: ").strip()
+    status = input("Статус: ").strip()
+    location = input("Место: ").strip()
+    
+    state['filters'] = {'name': name, 'category': category, 'status': status, 'location': location}
+    state['offset'] = 0
+    manager.display_items(filters=state['filters'])
+
+
+def _add(manager, state):
+    print("\n➕ Добавить предмет")
+    try:
+        name = input("Название: ").strip()
+        category = input("Категория: ").strip()
+        quantity = int(input("Количество: ").strip())
+        purchase_date = input("Дата (ГГГГ-ММ-ДД): ").strip()
+        status = input("Статус: ").strip()
+        location = input("Место: ").strip()
+        responsible_person = input("Ответственный: ").strip()
+        notes = input("Примечания: ").strip()
+        
+        manager.create_item(name, category, quantity, purchase_date, status, location, responsible_person, notes)
+        
+    except ValueError as e:
+        print(f"❌ Ошибка: {e}")
+
+
+def _edit(manager, state):
+    try:
+        item_id = int(input("\n✏️  ID для редактирования: ").strip())
+        
+        print("Новые значения (пусто - не менять):")
+        name = input("Название: ").strip() or None
+        category = input("Категория: ").strip() or None
+        quantity_input = input("Количество: ").strip()
+        quantity = int(quantity_input) if quantity_input else None
+        purchase_date = input("Дата: ").strip() or None
+        status = input("Статус: ").strip() or None
+        location = input("Место: ").strip() or None
+        responsible_person = input("Ответственный: ").strip() or None
+        notes = input("Примечания: ").strip() or None
+        
+        update_data = {
+            'name': name, 'category': category, 'quantity': quantity,
+            'purchase_date': purchase_date, 'status': status, 'location': location,
+            'responsible_person': responsible_person, 'notes': notes
+        }
         
-        for item in items:
-            print(f"{item[0]:<3} {item[1]:<15} {item[2]:<12} {item[3]:<6} {item[4]:<10} {item[5]:<12} {item[6]:<12} {item[7]:<12}")
+        update_data = {k: v for k, v in update_data.items() if v is not None}
+        manager.update_item(item_id, **update_data)
         
-        print(f"{'='*100}")
-        print(f"Всего: {len(items)}")
+    except ValueError:
+        print("❌ Неверный формат")
+
+
+def _delete(manager, state):
+    try:
+        item_id = int(input("\n🗑️  ID для удаления: ").strip())
+        confirm = input(f"Удалить ID {item_id}? (y/N): ").strip().lower()
+        if confirm == 'y':
+            manager.delete_item(item_id)
+    except ValueError:
+        print("❌ Неверный ID")
+
+
+def _detail(manager, state):
+    try:
+        item_id = int(input("\n🔎 ID для просмотра: ").strip())
+        manager.display_item_detail(item_id)
+    except ValueError:
+        print("❌ Неверный ID")
+
+
+def _next_page(manager, state):
+    offset = state['offset'] + PAGE_SIZE
+    if manager.display_items(offset=offset, filters=state['filters']):
+        state['offset'] = offset
+
+
+def _exit(manager, state):
+    print("👋 Выход!")
+    manager.close()
+    return True
+
+
+ACTIONS = {
+    '1': _show_all,
+    '2': _search,
+    '3': _add,
+    '4': _edit,
+    '5': _delete,
+    '6': _detail,
+    '7': _next_page,
+    '8': _exit,
+}
+
 
 def main():
     manager = InventoryManager()
+    atexit.register(manager.close)
+    state = {'filters': None, 'offset': 0}
     
     while True:
-        print("\n🏢 Учет инвентаря")
-        print("1. 📋 Показать все")
-        print("2. 🔍 Поиск")
-        print("3. ➕ Добавить")
-        print("4. ✏️  Редактировать")
-        print("5. 🗑️  Удалить")
-        print("6. 🚪 Выход")
-        
-        choice = input("\nВыберите действие (1-6): ").strip()
-        
-        if choice == '1':
-            items = manager.read_items()
-            manager.display_items(items)
-            
-        elif choice == '2':
-            print("\n🔍 Поиск (оставьте пустым для пропуска)")
-            name = input("Название: ").strip()
-            category = input("Категория: ").strip()
-            status = input("Статус: ").strip()
-            location = input("Место: ").strip()
-            
-            filters = {'name': name, 'category': category, 'status': status, 'location': location}
-            items = manager.read_items(filters)
-            manager.display_items(items)
-            
-        elif choice == '3':
-            print("\n➕ Добавить предмет")
-            try:
-                name = input("Название: ").strip()
-                category = input("Категория: ").strip()
-                quantity = int(input("Количество: ").strip())
-                purchase_date = input("Дата (ГГГГ-ММ-ДД): ").strip()
-                status = input("Статус: ").strip()
-                location = input("Место: ").strip()
-                responsible_person = input("Ответственный: ").strip()
-                notes = input("Примечания: ").strip()
-                
-                manager.create_item(name, category, quantity, purchase_date, status, location, responsible_person, notes)
-                
-            except ValueError as e:
-                print(f"❌ Ошибка: {e}")
-                
-        elif choice == '4':
-            try:
-                item_id = int(input("\n✏️  ID для редактирования: ").strip())
-                
-                print("Новые значения (пусто - не менять):")
-                name = input("Название: ").strip() or None
-                category = input("Категория: ").strip() or None
-                quantity_input = input("Количество: ").strip()
-                quantity = int(quantity_input) if quantity_input else None
-                purchase_date = input("Дата: ").strip() or None
-                status = input("Статус: ").strip() or None
-                location = input("Место: ").strip() or None
-                responsible_person = input("Ответственный: ").strip() or None
-                notes = input("Примечания: ").strip() or None
-                
-                update_data = {
-                    'name': name, 'category': category, 'quantity': quantity,
-                    'purchase_date': purchase_date, 'status': status, 'location': location,
-                    'responsible_person': responsible_person, 'notes': notes
-                }
-                
-                update_data = {k: v for k, v in update_data.items() if v is not None}
-                manager.update_item(item_id, **update_data)
-                
-            except ValueError:
-                print("❌ Неверный формат")
-                
-        elif choice == '5':
-            try:
-                item_id = int(input("\n🗑️  ID для удаления: ").strip())
-                confirm = input(f"Удалить ID {item_id}? (y/N): ").strip().lower()
-                if confirm == 'y':
-                    manager.delete_item(item_id)
-            except ValueError:
-                print("❌ Неверный ID")
-                
-        elif choice == '6':
-            print("👋 Выход!")
-            break
-            
-        else:
+        choice = input(MENU).strip()
+        action = ACTIONS.get(choice)
+        
+        if action is None:
             print("❌ Неверный выбор")
+        elif action(manager, state):
+            break
 
 if __name__ == "__main__":
     main()
\ No newline at end of file